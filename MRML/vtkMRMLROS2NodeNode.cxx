@@ -479,8 +479,11 @@ bool vtkMRMLROS2NodeNode::RemoveAndDeleteRobotNode(const std::string & robotName
     modelNode->Delete();
   }
 
-  auto parameterNodeID = node->GetNthNodeReferenceID("parameter", 0);
-  this->RemoveAndDeleteParameterNodeByNodeID(parameterNodeID);
+  // Robots with a description set directly don't have a parameter node
+  if (node->GetNumberOfNodeReferences("parameter") > 0) {
+    auto parameterNodeID = node->GetNthNodeReferenceID("parameter", 0);
+    this->RemoveAndDeleteParameterNodeByNodeID(parameterNodeID);
+  }
 
   // Remove the robot itself
   this->GetScene()->RemoveNode(node);
@@ -67,7 +67,10 @@ bool vtkMRMLROS2RobotNode::AddToROS2Node(const char * nodeId,
   mMRMLROS2Node = mrmlROSNodePtr;
   mNthRobot.mParameterNodeName = parameterNodeName;
   mNthRobot.mParameterName = parameterName;
-  SetRobotDescriptionParameterNode();
+  // without parameter node name, the description has to be set using SetRobotDescription
+  if (!parameterNodeName.empty()) {
+    SetRobotDescriptionParameterNode();
+  }
   SetRobotName(robotName);
   return true;
 }
@@ -141,6 +144,26 @@ bool vtkMRMLROS2RobotNode::ParseRobotDescription(void)
 }
 
 
+bool vtkMRMLROS2RobotNode::SetRobotDescription(const std::string & description)
+{
+  if (!mMRMLROS2Node) {
+    vtkErrorMacro(<< "SetRobotDescription: robot node needs to be added to a ROS2 node first");
+    return false;
+  }
+  if (mNumberOfLinks != 0) {
+    vtkErrorMacro(<< "SetRobotDescription: robot \"" << mRobotName << "\" has already been loaded");
+    return false;
+  }
+  mNthRobot.mRobotDescription = description;
+  if (!ParseRobotDescription()) {
+    vtkErrorMacro(<< "SetRobotDescription: unable to parse robot description for \"" << mRobotName << "\"");
+    return false;
+  }
+  SetupRobotVisualization();
+  return true;
+}
+
+
 void vtkMRMLROS2RobotNode::InitializeLookupListFromURDF(void)
 {
   // This function goes through the urdf file and populates a list of the parents and children of
@@ -43,6 +43,14 @@ class VTK_SLICER_ROS2_MODULE_MRML_EXPORT vtkMRMLROS2RobotNode: public vtkMRMLNod
   void ObserveParameterNode(vtkMRMLROS2ParameterNode * node);
 
   bool ParseRobotDescription(void);
+
+  /*! Set the robot description (URDF) directly instead of waiting
+    for the parameter node, then parse it and setup the
+    visualization.  This is mostly used for tests and benchmarks
+    that don't rely on an external robot state publisher.  In this
+    case, use an empty parameter node name when adding the robot so
+    no parameter node is created. */
+  bool SetRobotDescription(const std::string & description);
   void InitializeLookupListFromURDF(void);
   void InitializeOffsetListAndModelFilesFromURDF(void);
 
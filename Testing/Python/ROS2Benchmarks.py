@@ -0,0 +1,574 @@
+import os
+import math
+import json
+import time
+import platform
+import datetime
+import tempfile
+import vtk
+
+import slicer
+from slicer.ScriptedLoadableModule import *
+try:
+    import psutil
+except ImportError:
+    slicer.util.pip_install('psutil')
+    import psutil
+
+#
+# ROS2Benchmarks
+#
+
+class ROS2Benchmarks(ScriptedLoadableModule):
+    """Uses ScriptedLoadableModule base class, available at:
+    https://github.com/Slicer/Slicer/blob/main/Base/Python/slicer/ScriptedLoadableModule.py
+    """
+
+    def __init__(self, parent):
+        ScriptedLoadableModule.__init__(self, parent)
+        self.parent.title = "ROS2Benchmarks"
+        self.parent.categories = ["IGT"]
+        self.parent.dependencies = ['ROS2']
+        self.parent.contributors = ["Aravind Kumar (JHU)"]
+        self.parent.helpText = """
+This module is used to benchmark the SlicerROS2 module.  It doesn't provide a UI and can be used in the Python interpreter using:
+benchmarks = slicer.util.getModuleLogic('ROS2Benchmarks')
+results = benchmarks.run()
+All measurements are performed in-process, without calling the ros2 command line tools or any external node.
+"""
+        self.parent.acknowledgementText = """
+See the ROS2Tests module.
+"""
+
+
+class ROS2BenchmarksWidget(ScriptedLoadableModuleWidget):
+    """Uses ScriptedLoadableModuleWidget base class, available at:
+    https://github.com/Slicer/Slicer/blob/main/Base/Python/slicer/ScriptedLoadableModule.py
+    """
+
+    def __init__(self, parent=None):
+        ScriptedLoadableModuleWidget.__init__(self, parent)
+        self.logic = None
+
+    def setup(self):
+        ScriptedLoadableModuleWidget.setup(self)
+        self.logic = ROS2BenchmarksLogic()
+
+
+#
+# ROS2BenchmarksLogic
+#
+
+class ROS2BenchmarksLogic(ScriptedLoadableModuleLogic):
+    """Throughput, latency, spin cost, memory and robot loading
+    benchmarks for the SlicerROS2 MRML nodes.  Results are saved as a
+    JSON file so they can be compared between releases using
+    compare().
+    Uses ScriptedLoadableModuleLogic base class, available at:
+    https://github.com/Slicer/Slicer/blob/main/Base/Python/slicer/ScriptedLoadableModule.py
+    """
+
+    # types with both a default publisher and subscriber
+    pub_sub_types = ['String', 'Bool', 'Int', 'Double',
+                     'IntArray', 'DoubleArray', 'IntTable', 'DoubleTable',
+                     'PoseStamped']
+    # types with only a default publisher
+    pub_only_types = ['UInt8Image']
+
+    # publishers are created with a queue size of 10, don't send more
+    # than that before spinning or messages might be dropped
+    batch_size = 10
+
+    def __init__(self):
+        ScriptedLoadableModuleLogic.__init__(self)
+        self.ros2Node = None
+        self.results = []
+
+    @staticmethod
+    def percentile(sortedValues, p):
+        # nearest rank percentile, sortedValues must be sorted
+        if not sortedValues:
+            return float('nan')
+        index = max(0, min(len(sortedValues) - 1, int(math.ceil(p / 100.0 * len(sortedValues))) - 1))
+        return sortedValues[index]
+
+    @staticmethod
+    def create_message(type, index = 0):
+        # returns a message for a given type, index is used to make the message different each time
+        if type == 'String':
+            return 'xkcd ' + str(index)
+        if type == 'Bool':
+            return (index % 2) == 0
+        if type == 'Int':
+            return index
+        if type == 'Double':
+            return index * 3.1415
+        if type in ['IntArray', 'DoubleArray']:
+            array = vtk.vtkIntArray() if type == 'IntArray' else vtk.vtkDoubleArray()
+            array.SetNumberOfValues(100)
+            for i in range(100):
+                array.SetValue(i, index + i)
+            return array
+        if type in ['IntTable', 'DoubleTable']:
+            table = vtk.vtkTable()
+            for c in range(4):
+                column = vtk.vtkIntArray() if type == 'IntTable' else vtk.vtkDoubleArray()
+                column.SetName('c' + str(c))
+                column.SetNumberOfValues(25)
+                for r in range(25):
+                    column.SetValue(r, index + 25 * c + r)
+                table.AddColumn(column)
+            return table
+        if type == 'PoseStamped':
+            matrix = vtk.vtkMatrix4x4()
+            matrix.SetElement(0, 3, float(index))
+            return matrix
+        if type == 'UInt8Image':
+            # 640x480 grayscale image
+            image = vtk.vtkTypeUInt8Array()
+            image.SetNumberOfComponents(640)
+            image.SetNumberOfTuples(480)
+            image.Fill(index % 256)
+            return image
+        raise ValueError('create_message: unknown type ' + type)
+
+    def add_result(self, name, value, unit, better, threshold = 0.0):
+        # better is either 'higher' or 'lower', threshold is the absolute
+        # noise floor, both used by compare
+        self.results.append({'name': name, 'value': value, 'unit': unit, 'better': better, 'threshold': threshold})
+        print('  {:<50} {:>14.3f} {}'.format(name, value, unit))
+
+    def add_failure(self, name, reason):
+        # failures are reported by compare even if the baseline doesn't have them
+        self.results.append({'name': name + '/failed', 'value': 1, 'unit': 'failure', 'better': 'lower'})
+        print('  {:<50} FAILED: {}'.format(name, reason))
+
+    def add_distribution(self, name, samples, unit, scale = 1.0):
+        # store mean and percentiles for a list of samples, all lower is better
+        values = sorted([s * scale for s in samples])
+        if not values:
+            return
+        self.add_result(name + '/mean', sum(values) / len(values), unit, 'lower')
+        for p in [50, 90, 99]:
+            self.add_result(name + '/p' + str(p), self.percentile(values, p), unit, 'lower')
+        self.add_result(name + '/max', values[-1], unit, 'lower')
+
+    def spin_until(self, condition, timeout):
+        # spin the benchmark node until condition is true, returns false on timeout
+        deadline = time.perf_counter() + timeout
+        while not condition():
+            if time.perf_counter() > deadline:
+                return False
+            self.ros2Node.Spin()
+        return True
+
+    def create_pub_sub(self, type, timeout):
+        # returns None if the first message is not received before timeout
+        topic = 'slicer_benchmark_' + type.lower()
+        pub = self.ros2Node.CreateAndAddPublisherNode('vtkMRMLROS2Publisher' + type + 'Node', topic)
+        sub = self.ros2Node.CreateAndAddSubscriberNode('vtkMRMLROS2Subscriber' + type + 'Node', topic)
+        # wait for discovery, keep publishing until the first message is received
+        message = self.create_message(type)
+        deadline = time.perf_counter() + timeout
+        while sub.GetNumberOfMessages() == 0:
+            if time.perf_counter() > deadline:
+                self.add_failure('pub_sub/' + type + '/discovery', 'no message received after ' + str(timeout) + 's')
+                self.delete_pub_sub(topic)
+                return None
+            pub.Publish(message)
+            self.ros2Node.Spin()
+        # drain messages still in flight so they don't count in the measurements
+        for i in range(10):
+            self.ros2Node.Spin()
+        return topic, pub, sub
+
+    def delete_pub_sub(self, topic):
+        self.ros2Node.RemoveAndDeletePublisherNode(topic)
+        self.ros2Node.RemoveAndDeleteSubscriberNode(topic)
+
+    def benchmark_pub_sub(self, type, numberOfMessages, timeout):
+        created = self.create_pub_sub(type, timeout)
+        if created is None:
+            return
+        topic, pub, sub = created
+        prefix = 'pub_sub/' + type
+        messages = [self.create_message(type, i) for i in range(self.batch_size)]
+
+        # throughput, send by batches and wait for all messages in batch
+        initialCount = sub.GetNumberOfMessages()
+        start = time.perf_counter()
+        sent = 0
+        while sent < numberOfMessages:
+            for message in messages:
+                pub.Publish(message)
+            sent += len(messages)
+            if not self.spin_until(lambda: sub.GetNumberOfMessages() - initialCount >= sent, timeout):
+                break
+        elapsed = time.perf_counter() - start
+        received = sub.GetNumberOfMessages() - initialCount
+        self.add_result(prefix + '/throughput', received / elapsed, 'msg/s', 'higher')
+        self.add_result(prefix + '/dropped', sent - received, 'msg', 'lower')
+
+        # end-to-end latency, from Publish to the message being available in the subscriber
+        latencies = []
+        for i in range(numberOfMessages):
+            count = sub.GetNumberOfMessages()
+            message = messages[i % len(messages)]
+            start = time.perf_counter()
+            pub.Publish(message)
+            if not self.spin_until(lambda: sub.GetNumberOfMessages() > count, timeout):
+                self.add_failure(prefix + '/latency', 'message ' + str(i) + ' not received after ' + str(timeout) + 's')
+                break
+            latencies.append(time.perf_counter() - start)
+        self.add_distribution(prefix + '/latency', latencies, 'us', 1.0e6)
+
+        self.delete_pub_sub(topic)
+
+    def benchmark_pub_only(self, type, numberOfMessages):
+        topic = 'slicer_benchmark_' + type.lower()
+        pub = self.ros2Node.CreateAndAddPublisherNode('vtkMRMLROS2Publisher' + type + 'Node', topic)
+        prefix = 'pub/' + type
+        message = self.create_message(type)
+        durations = []
+        start = time.perf_counter()
+        for i in range(numberOfMessages):
+            publishStart = time.perf_counter()
+            pub.Publish(message)
+            durations.append(time.perf_counter() - publishStart)
+            if (i % self.batch_size) == 0:
+                self.ros2Node.Spin()
+        elapsed = time.perf_counter() - start
+        self.add_result(prefix + '/throughput', numberOfMessages / elapsed, 'msg/s', 'higher')
+        self.add_distribution(prefix + '/publish', durations, 'us', 1.0e6)
+        self.ros2Node.RemoveAndDeletePublisherNode(topic)
+
+    def benchmark_spin(self, name, numberOfTicks):
+        # node: one Spin of the benchmark node only
+        # logic: one Spin of the ROS2 module logic, i.e. one Slicer tick,
+        # which spins all ROS nodes, including the default "slicer" node
+        # and the benchmark node
+        ros2Logic = slicer.util.getModuleLogic('ROS2')
+        nodeDurations = []
+        for i in range(numberOfTicks):
+            start = time.perf_counter()
+            self.ros2Node.Spin()
+            nodeDurations.append(time.perf_counter() - start)
+        logicDurations = []
+        for i in range(numberOfTicks):
+            start = time.perf_counter()
+            ros2Logic.Spin()
+            logicDurations.append(time.perf_counter() - start)
+        self.add_distribution('spin/' + name + '/node', nodeDurations, 'us', 1.0e6)
+        self.add_distribution('spin/' + name + '/logic', logicDurations, 'us', 1.0e6)
+
+    def benchmark_spin_with_subscribers(self, numberOfTicks, timeout):
+        # idle subscribers and publishers for all default types
+        topics = []
+        for type in self.pub_sub_types:
+            created = self.create_pub_sub(type, timeout)
+            if created is not None:
+                topics.append(created[0])
+        self.add_result('spin/idle_pub_sub/number_of_pub_sub', len(topics), 'pub_sub', 'higher')
+        self.benchmark_spin('idle_pub_sub', numberOfTicks)
+        for topic in topics:
+            self.delete_pub_sub(topic)
+
+    # RSS changes by pages and allocator chunks, ignore smaller changes in compare
+    memory_threshold = 1024.0 # KiB
+
+    def benchmark_memory(self, type, numberOfMessages, timeout):
+        # memory growth over a long run, after a short warm up
+        created = self.create_pub_sub(type, timeout)
+        if created is None:
+            return
+        topic, pub, sub = created
+        messages = [self.create_message(type, i) for i in range(self.batch_size)]
+        process = psutil.Process()
+
+        def send(count):
+            initialCount = sub.GetNumberOfMessages()
+            sent = 0
+            while sent < count:
+                for message in messages:
+                    pub.Publish(message)
+                sent += len(messages)
+                if not self.spin_until(lambda: sub.GetNumberOfMessages() - initialCount >= sent, timeout):
+                    return False
+                sub.GetLastMessage()
+            return True
+
+        prefix = 'memory/' + type
+        if not send(max(self.batch_size, numberOfMessages // 10)):
+            self.add_failure(prefix, 'messages not received after ' + str(timeout) + 's')
+            self.delete_pub_sub(topic)
+            return
+        initialMemory = process.memory_info().rss
+        if not send(numberOfMessages):
+            self.add_failure(prefix, 'messages not received after ' + str(timeout) + 's')
+            self.delete_pub_sub(topic)
+            return
+        growth = process.memory_info().rss - initialMemory
+        self.add_result(prefix + '/growth', growth / 1024.0, 'KiB', 'lower',
+                        self.memory_threshold)
+        self.add_result(prefix + '/growth_per_1000_messages', 1000.0 * growth / numberOfMessages / 1024.0, 'KiB', 'lower',
+                        1000.0 * self.memory_threshold / numberOfMessages)
+        self.delete_pub_sub(topic)
+
+    def benchmark_tf2(self, numberOfLookups, timeout):
+        # latency between a broadcast and the lookup node being updated
+        broadcaster = self.ros2Node.CreateAndAddTf2BroadcasterNode('BenchmarkParent', 'BenchmarkChild')
+        lookup = self.ros2Node.CreateAndAddTf2LookupNode('BenchmarkParent', 'BenchmarkChild')
+        broadcastMatrix = vtk.vtkMatrix4x4()
+        lookupMatrix = vtk.vtkMatrix4x4()
+
+        def updated(value):
+            lookup.GetMatrixTransformToParent(lookupMatrix)
+            return abs(lookupMatrix.GetElement(0, 3) - value) < 1.0e-6
+
+        latencies = []
+        for i in range(numberOfLookups):
+            value = float(i + 1)
+            broadcastMatrix.SetElement(0, 3, value)
+            start = time.perf_counter()
+            broadcaster.Broadcast(broadcastMatrix)
+            if not self.spin_until(lambda: updated(value), timeout):
+                self.add_failure('tf2/broadcast_to_lookup/latency', 'lookup not updated after ' + str(timeout) + 's')
+                break
+            latencies.append(time.perf_counter() - start)
+        self.add_distribution('tf2/broadcast_to_lookup/latency', latencies, 'us', 1.0e6)
+
+        self.ros2Node.RemoveAndDeleteTf2LookupNode('BenchmarkParent', 'BenchmarkChild')
+        self.ros2Node.RemoveAndDeleteTf2BroadcasterNode('BenchmarkParent', 'BenchmarkChild')
+
+    @staticmethod
+    def create_urdf(robotName, numberOfLinks, meshFile):
+        # serial chain of numberOfLinks links, all using the same mesh.
+        # Frames are prefixed by the robot name so transforms from
+        # previous robots in the tf2 buffer can't be used.
+        urdf = ['<?xml version="1.0"?>',
+                '<robot name="' + robotName + '">',
+                '  <material name="grey"><color rgba="0.5 0.5 0.5 1.0"/></material>']
+        for i in range(numberOfLinks):
+            urdf += ['  <link name="' + robotName + '_link_' + str(i) + '">',
+                     '    <visual>',
+                     '      <origin xyz="0 0 0" rpy="0 0 0"/>',
+                     '      <geometry><mesh filename="' + meshFile + '" scale="1 1 1"/></geometry>',
+                     '      <material name="grey"/>',
+                     '    </visual>',
+                     '  </link>']
+            if i > 0:
+                urdf += ['  <joint name="' + robotName + '_joint_' + str(i) + '" type="fixed">',
+                         '    <parent link="' + robotName + '_link_' + str(i - 1) + '"/>',
+                         '    <child link="' + robotName + '_link_' + str(i) + '"/>',
+                         '    <origin xyz="0 0 0.1" rpy="0 0 0"/>',
+                         '  </joint>']
+        urdf.append('</robot>')
+        return '\n'.join(urdf)
+
+    def benchmark_robot(self, numberOfLinks, meshFile, numberOfTicks, timeout):
+        prefix = 'robot/' + str(numberOfLinks) + '_links'
+        robotName = 'slicer_benchmark_' + str(numberOfLinks)
+        link = lambda i: robotName + '_link_' + str(i)
+        urdf = self.create_urdf(robotName, numberOfLinks, meshFile)
+
+        # broadcast the joints and wait until the whole chain is in
+        # the tf2 buffer before loading the robot, otherwise each
+        # unresolved lookup reports an error on every spin
+        offset = vtk.vtkMatrix4x4()
+        offset.SetElement(2, 3, 100.0)
+        broadcasters = []
+        for i in range(1, numberOfLinks):
+            broadcasters.append(self.ros2Node.CreateAndAddTf2BroadcasterNode(link(i - 1), link(i)))
+        primed = True
+        if numberOfLinks > 1:
+            probe = self.ros2Node.CreateAndAddTf2LookupNode(link(0), link(numberOfLinks - 1))
+            probeMatrix = vtk.vtkMatrix4x4()
+            expected = 100.0 * (numberOfLinks - 1)
+
+            def chainAvailable():
+                for broadcaster in broadcasters:
+                    broadcaster.Broadcast(offset)
+                probe.GetMatrixTransformToParent(probeMatrix)
+                return abs(probeMatrix.GetElement(2, 3) - expected) < 1.0e-6
+
+            primed = self.spin_until(chainAvailable, timeout)
+            self.ros2Node.RemoveAndDeleteTf2LookupNode(link(0), link(numberOfLinks - 1))
+
+        def cleanup():
+            for i in range(1, numberOfLinks):
+                self.ros2Node.RemoveAndDeleteTf2BroadcasterNode(link(i - 1), link(i))
+
+        if not primed:
+            self.add_failure(prefix + '/tf2_chain', 'transforms not available after ' + str(timeout) + 's')
+            cleanup()
+            return
+
+        # no parameter node name, the description is set directly
+        robot = self.ros2Node.CreateAndAddRobotNode(robotName, '', 'robot_description')
+        numberOfNodes = slicer.mrmlScene.GetNumberOfNodes()
+        start = time.perf_counter()
+        loaded = robot.SetRobotDescription(urdf)
+        loadTime = time.perf_counter() - start
+        if not loaded:
+            self.add_failure(prefix + '/load', 'unable to load robot description')
+            self.ros2Node.RemoveAndDeleteRobotNode(robotName)
+            cleanup()
+            return
+        self.add_result(prefix + '/load', loadTime * 1.0e3, 'ms', 'lower')
+        self.add_result(prefix + '/mrml_nodes_added', slicer.mrmlScene.GetNumberOfNodes() - numberOfNodes, 'nodes', 'lower')
+
+        # time for all lookups to be updated from the tf2 buffer
+        lookups = [robot.GetNthNodeReference('lookup', i) for i in range(1, robot.GetNumberOfNodeReferences('lookup'))]
+        lookupMatrix = vtk.vtkMatrix4x4()
+
+        def resolved():
+            for lookup in lookups:
+                lookup.GetMatrixTransformToParent(lookupMatrix)
+                if abs(lookupMatrix.GetElement(2, 3) - 100.0) > 1.0e-6:
+                    return False
+            return True
+
+        start = time.perf_counter()
+        if self.spin_until(resolved, timeout):
+            self.add_result(prefix + '/time_to_resolve_lookups', (time.perf_counter() - start) * 1.0e3, 'ms', 'lower')
+            self.benchmark_spin(str(numberOfLinks) + '_tf2_lookups', numberOfTicks)
+        else:
+            self.add_failure(prefix + '/time_to_resolve_lookups', 'lookups not resolved after ' + str(timeout) + 's')
+
+        self.ros2Node.RemoveAndDeleteRobotNode(robotName)
+        cleanup()
+
+    @staticmethod
+    def metadata():
+        environment = {}
+        for variable in ['ROS_DISTRO', 'ROS_DOMAIN_ID', 'ROS_LOCALHOST_ONLY', 'RMW_IMPLEMENTATION']:
+            environment[variable] = os.environ.get(variable, '')
+        return {
+            'date': datetime.datetime.now().isoformat(),
+            'slicer_version': slicer.app.applicationVersion,
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'environment': environment,
+        }
+
+    def run(self,
+            outputFile = None,
+            numberOfMessages = 1000,
+            numberOfTicks = 1000,
+            numberOfMemoryMessages = 5000,
+            numberOfLinks = (1, 10, 50),
+            timeout = 5.0):
+        """Run all the benchmarks and save the results in outputFile
+        (JSON).  If outputFile is not provided, the results are saved
+        in Slicer's temporary directory.  Returns the path of the
+        results file.  numberOfMemoryMessages is per type."""
+        print('Running all benchmarks...')
+        self.results = []
+        parameters = {
+            'numberOfMessages': numberOfMessages,
+            'numberOfTicks': numberOfTicks,
+            'numberOfMemoryMessages': numberOfMemoryMessages,
+            'numberOfLinks': list(numberOfLinks),
+            'timeout': timeout,
+        }
+
+        self.ros2Node = slicer.mrmlScene.AddNewNodeByClass('vtkMRMLROS2NodeNode')
+        self.ros2Node.Create('slicer_benchmark')
+        self.ros2Node.Spin()
+        meshDirectory = tempfile.mkdtemp(prefix = 'ROS2Benchmarks')
+        try:
+            print('\nSpin cost per tick')
+            self.benchmark_spin('idle', numberOfTicks)
+            self.benchmark_spin_with_subscribers(numberOfTicks, timeout)
+
+            print('\nPublishers and subscribers')
+            for type in self.pub_sub_types:
+                self.benchmark_pub_sub(type, numberOfMessages, timeout)
+            for type in self.pub_only_types:
+                self.benchmark_pub_only(type, numberOfMessages)
+
+            print('\nMemory growth')
+            for type in self.pub_sub_types:
+                self.benchmark_memory(type, numberOfMemoryMessages, timeout)
+
+            print('\nTf2')
+            self.benchmark_tf2(numberOfMessages, timeout)
+
+            print('\nRobot')
+            cube = vtk.vtkCubeSource()
+            writer = vtk.vtkSTLWriter()
+            writer.SetInputConnection(cube.GetOutputPort())
+            meshFile = os.path.join(meshDirectory, 'link.stl')
+            writer.SetFileName(meshFile)
+            writer.Write()
+            for links in numberOfLinks:
+                self.benchmark_robot(links, meshFile, numberOfTicks, timeout)
+        finally:
+            # Destroy also removes the node from the scene
+            self.ros2Node.Destroy()
+            self.ros2Node = None
+            for file in os.listdir(meshDirectory):
+                os.remove(os.path.join(meshDirectory, file))
+            os.rmdir(meshDirectory)
+
+        if outputFile is None:
+            outputFile = os.path.join(slicer.app.temporaryPath,
+                                      'ROS2Benchmarks-' + datetime.datetime.now().strftime('%Y%m%d-%H%M%S') + '.json')
+        with open(outputFile, 'w') as f:
+            json.dump({'metadata': self.metadata(),
+                       'parameters': parameters,
+                       'results': self.results}, f, indent = 2)
+        print('\nResults saved in ' + outputFile)
+        return outputFile
+
+    @staticmethod
+    def compare(baselineFile, currentFile, tolerance = 0.2):
+        """Compare two results files and return the list of metrics
+        which are worse by more than tolerance (relative) in the
+        current file.  Failures in the current file and metrics from
+        the baseline missing in the current file are also reported.
+        Changes smaller than the threshold stored with each metric
+        are ignored.  Otherwise, metrics with a baseline of zero are
+        compared in absolute value, i.e. any degradation is a
+        regression."""
+        with open(baselineFile) as f:
+            baseline = {r['name']: r for r in json.load(f)['results']}
+        with open(currentFile) as f:
+            current = {r['name']: r for r in json.load(f)['results']}
+        regressions = []
+        for name, result in current.items():
+            if result['unit'] == 'failure':
+                regressions.append(name)
+                print('{:<50} failed'.format(name))
+                continue
+            reference = baseline.get(name)
+            if reference is None:
+                continue
+            change = result['value'] - reference['value']
+            if result['better'] == 'higher':
+                change = -change
+            if change <= result.get('threshold', 0.0):
+                regressed = False
+            elif reference['value'] == 0:
+                regressed = True
+            else:
+                regressed = change / abs(reference['value']) > tolerance
+            if regressed:
+                regressions.append(name)
+                print('{:<50} {:>14.3f} -> {:>14.3f} {}'.format(
+                    name, reference['value'], result['value'], result['unit']))
+        for name, reference in baseline.items():
+            if name in current:
+                continue
+            if reference['unit'] == 'failure':
+                print('{:<50} fixed'.format(name))
+            else:
+                regressions.append(name)
+                print('{:<50} missing'.format(name))
+        return regressions
+
+
+# benchmarks = slicer.util.getModuleLogic('ROS2Benchmarks')
+# results = benchmarks.run()
+# benchmarks.compare('baseline.json', results)
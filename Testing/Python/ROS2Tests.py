@@ -16,6 +16,8 @@ except:
     slicer.util.pip_install('psutil')
 
 import warnings
+import json
+import tempfile
 
 #
 # ROS2Tests
@@ -536,6 +538,105 @@ class ROS2TestsLogic(ScriptedLoadableModuleLogic):
             self.ros2Node.Destroy()
 
 
+    class TestRobotNode(unittest.TestCase):
+        def setUp(self):
+            print("\nCreating ROS2 node to test Robot Nodes..")
+            self.ros2Node = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLROS2NodeNode")
+            self.ros2Node.Create("testNodeRobot")
+            ROS2TestsLogic.spin_some()
+            # mesh used by all links
+            self.meshDirectory = tempfile.mkdtemp(prefix = "ROS2Tests")
+            self.meshFile = os.path.join(self.meshDirectory, "link.stl")
+            cube = vtk.vtkCubeSource()
+            writer = vtk.vtkSTLWriter()
+            writer.SetInputConnection(cube.GetOutputPort())
+            writer.SetFileName(self.meshFile)
+            writer.Write()
+
+        def test_robot_description_without_parameter_node(self):
+            print("\nTesting robot loaded from description - Starting..")
+            urdf = ('<?xml version="1.0"?>'
+                    '<robot name="test_robot">'
+                    '<link name="test_link_0"><visual><geometry><mesh filename="' + self.meshFile + '"/></geometry></visual></link>'
+                    '<link name="test_link_1"><visual><geometry><mesh filename="' + self.meshFile + '"/></geometry></visual></link>'
+                    '<joint name="test_joint_1" type="fixed"><parent link="test_link_0"/><child link="test_link_1"/></joint>'
+                    '</robot>')
+            numberOfParameterNodes = slicer.mrmlScene.GetNodesByClass("vtkMRMLROS2ParameterNode").GetNumberOfItems()
+            # empty parameter node name, no parameter node should be created
+            robot = self.ros2Node.CreateAndAddRobotNode("test_robot", "", "robot_description")
+            self.assertEqual(robot.GetNumberOfNodeReferences("parameter"), 0, "Robot has a parameter node")
+            self.assertEqual(slicer.mrmlScene.GetNodesByClass("vtkMRMLROS2ParameterNode").GetNumberOfItems(),
+                             numberOfParameterNodes, "Parameter node created")
+
+            self.assertTrue(robot.SetRobotDescription(urdf), "Robot description not loaded")
+            self.assertEqual(robot.GetNumberOfNodeReferences("lookup"), 2, "Incorrect number of lookups")
+            self.assertEqual(robot.GetNumberOfNodeReferences("model"), 2, "Incorrect number of models")
+            # robot can't be loaded twice
+            self.assertFalse(robot.SetRobotDescription(urdf), "Robot description loaded twice")
+
+            self.assertTrue(self.ros2Node.RemoveAndDeleteRobotNode("test_robot"), "Robot not deleted")
+            self.assertEqual(slicer.mrmlScene.GetNodesByClass("vtkMRMLROS2ParameterNode").GetNumberOfItems(),
+                             numberOfParameterNodes, "Parameter node left behind")
+            print("Testing robot loaded from description - Done")
+
+        def tearDown(self):
+            os.remove(self.meshFile)
+            os.rmdir(self.meshDirectory)
+            self.ros2Node.Destroy()
+
+
+    # It checks the helpers used to analyze the benchmark results, this doesn't run the benchmarks
+    class TestBenchmarksResults(unittest.TestCase):
+        def setUp(self):
+            self.benchmarks = slicer.util.getModuleLogic('ROS2Benchmarks')
+            self.files = []
+
+        def write_results(self, results):
+            handle, fileName = tempfile.mkstemp(suffix = ".json")
+            with os.fdopen(handle, "w") as f:
+                json.dump({"results": results}, f)
+            self.files.append(fileName)
+            return fileName
+
+        @staticmethod
+        def result(name, value, better = "lower", threshold = 0.0, unit = "us"):
+            return {"name": name, "value": value, "unit": unit, "better": better, "threshold": threshold}
+
+        def test_percentile(self):
+            values = list(range(1, 11))
+            self.assertEqual(self.benchmarks.percentile(values, 50), 5)
+            self.assertEqual(self.benchmarks.percentile(values, 90), 9)
+            self.assertEqual(self.benchmarks.percentile(values, 99), 10)
+            self.assertEqual(self.benchmarks.percentile([3], 50), 3)
+
+        def test_compare(self):
+            baseline = self.write_results([
+                self.result("slower", 100.0),
+                self.result("noise", 100.0),
+                self.result("throughput", 100.0, "higher"),
+                self.result("dropped", 0, unit = "msg"),
+                self.result("memory_page", 0.0, threshold = 1024.0, unit = "KiB"),
+                self.result("memory_double", 4.0, threshold = 1024.0, unit = "KiB"),
+                self.result("missing", 1.0),
+                self.result("fixed/failed", 1, unit = "failure"),
+            ])
+            current = self.write_results([
+                self.result("slower", 130.0),
+                self.result("noise", 110.0),
+                self.result("throughput", 70.0, "higher"),
+                self.result("dropped", 1, unit = "msg"),
+                self.result("memory_page", 4.0, threshold = 1024.0, unit = "KiB"),
+                self.result("memory_double", 8.0, threshold = 1024.0, unit = "KiB"),
+                self.result("new/failed", 1, unit = "failure"),
+            ])
+            self.assertEqual(sorted(self.benchmarks.compare(baseline, current)),
+                             ["dropped", "missing", "new/failed", "slower", "throughput"])
+
+        def tearDown(self):
+            for fileName in self.files:
+                os.remove(fileName)
+
+
     def run(self):
         print('Running all tests...')
 
@@ -544,6 +645,8 @@ class ROS2TestsLogic(ScriptedLoadableModuleLogic):
         suite.addTest(unittest.makeSuite(ROS2TestsLogic.TestCreateAndAddPubSub))
         suite.addTest(unittest.makeSuite(ROS2TestsLogic.TestParameterNode))
         suite.addTest(unittest.makeSuite(ROS2TestsLogic.TestTf2BroadcasterAndLookupNode))
+        suite.addTest(unittest.makeSuite(ROS2TestsLogic.TestRobotNode))
+        suite.addTest(unittest.makeSuite(ROS2TestsLogic.TestBenchmarksResults))
 
         runner = unittest.TextTestRunner()
         runner.run(suite)